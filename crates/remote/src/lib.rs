@@ -37,7 +37,7 @@ use thiserror::Error;
 /// FutureSDR Remote Error
 #[derive(Debug, Error)]
 pub enum Error {
-    /// Error in [`hyper`] crate.
+    /// Error in [`reqwest`] crate.
     #[error("Reqwest")]
     Reqwest(#[from] reqwest::Error),
     /// Wrong [`Flowgraph`] ID.
@@ -1,13 +1,15 @@
+use futures::future::try_join_all;
 use futuresdr_types::BlockDescription;
 use futuresdr_types::FlowgraphDescription;
 use futuresdr_types::Pmt;
 use reqwest::Client;
 use reqwest::IntoUrl;
 use serde::Deserialize;
+use std::collections::HashMap;
 
 use crate::Error;
 
-async fn get<T: for<'a> Deserialize<'a>>(client: Client, url: impl IntoUrl) -> Result<T, Error> {
+async fn get<T: for<'a> Deserialize<'a>>(client: &Client, url: impl IntoUrl) -> Result<T, Error> {
     Ok(client.get(url).send().await?.json::<T>().await?)
 }
 
@@ -19,6 +21,9 @@ pub struct Remote {
 
 impl Remote {
     /// Create a [`Remote`].
+    ///
+    /// The HTTP client keeps a pool of keep-alive connections, which is shared by all
+    /// [`Flowgraphs`](Flowgraph) and [`Blocks`](Block) obtained through this [`Remote`].
     pub fn new<I: Into<String>>(url: I) -> Self {
         Self {
             client: Client::new(),
@@ -37,14 +42,12 @@ impl Remote {
 
     /// Get a list of all running [`Flowgraphs`](Flowgraph).
     pub async fn flowgraphs(&self) -> Result<Vec<Flowgraph>, Error> {
-        let ids: Vec<usize> = get(self.client.clone(), format!("{}/api/fg/", self.url)).await?;
-        let mut v = Vec::new();
-
-        for i in ids.into_iter() {
-            let fg: FlowgraphDescription =
-                get(self.client.clone(), format!("{}/api/fg/{}/", self.url, i)).await?;
-            v.push(fg);
-        }
+        let ids: Vec<usize> = get(&self.client, format!("{}/api/fg/", self.url)).await?;
+        let v: Vec<FlowgraphDescription> = try_join_all(
+            ids.into_iter()
+                .map(|i| get(&self.client, format!("{}/api/fg/{}/", self.url, i))),
+        )
+        .await?;
 
         let v = v
             .into_iter()
@@ -73,11 +76,7 @@ pub struct Flowgraph {
 impl Flowgraph {
     /// Update the [`Flowgraph`], getting current blocks and connections.
     pub async fn update(&mut self) -> Result<(), Error> {
-        self.description = get(
-            self.client.clone(),
-            format!("{}/api/fg/{}/", self.url, self.id),
-        )
-        .await?;
+        self.description = get(&self.client, format!("{}/api/fg/{}/", self.url, self.id)).await?;
         Ok(())
     }
 
@@ -86,12 +85,7 @@ impl Flowgraph {
         self.description
             .blocks
             .iter()
-            .map(|d| Block {
-                description: d.clone(),
-                client: self.client.clone(),
-                url: self.url.clone(),
-                flowgraph_id: self.id,
-            })
+            .map(|d| self.make_block(d))
             .collect()
     }
 
@@ -101,39 +95,45 @@ impl Flowgraph {
             .blocks
             .iter()
             .find(|x| x.id == id)
-            .map(|d| Block {
-                description: d.clone(),
-                client: self.client.clone(),
-                url: self.url.clone(),
-                flowgraph_id: self.id,
-            })
+            .map(|d| self.make_block(d))
     }
 
     /// Get a list of all message [`Connections`](Connection) of the [`Flowgraph`].
     pub fn message_connections(&self) -> Vec<Connection> {
-        self.description
-            .message_edges
-            .iter()
-            .map(|d| Connection {
-                connection_type: ConnectionType::Message,
-                src_block: self.block(d.0).unwrap(),
-                src_port: d.1,
-                dst_block: self.block(d.2).unwrap(),
-                dst_port: d.3,
-            })
-            .collect()
+        self.connections(ConnectionType::Message, &self.description.message_edges)
     }
 
     /// Get a list of all stream [`Connections`](Connection) of the [`Flowgraph`].
     pub fn stream_connections(&self) -> Vec<Connection> {
-        self.description
-            .stream_edges
+        self.connections(ConnectionType::Stream, &self.description.stream_edges)
+    }
+
+    fn make_block(&self, description: &BlockDescription) -> Block {
+        Block {
+            description: description.clone(),
+            client: self.client.clone(),
+            url: self.url.clone(),
+            flowgraph_id: self.id,
+        }
+    }
+
+    fn connections(
+        &self,
+        connection_type: ConnectionType,
+        edges: &[(usize, usize, usize, usize)],
+    ) -> Vec<Connection> {
+        let blocks: HashMap<usize, Block> = self
+            .blocks()
+            .into_iter()
+            .map(|b| (b.description.id, b))
+            .collect();
+        edges
             .iter()
             .map(|d| Connection {
-                connection_type: ConnectionType::Stream,
-                src_block: self.block(d.0).unwrap(),
+                connection_type: connection_type.clone(),
+                src_block: blocks[&d.0].clone(),
                 src_port: d.1,
-                dst_block: self.block(d.2).unwrap(),
+                dst_block: blocks[&d.2].clone(),
                 dst_port: d.3,
             })
             .collect()
@@ -175,7 +175,7 @@ impl Block {
     /// Update the [`Block`], retrieving a new [`BlockDescription`] from the [`Flowgraph`].
     pub async fn update(&mut self) -> Result<(), Error> {
         self.description = get(
-            self.client.clone(),
+            &self.client,
             format!(
                 "{}/api/fg/{}/block/{}/",
                 self.url, self.flowgraph_id, self.description.id
@@ -195,16 +195,14 @@ impl Block {
 
     /// Call a message handler of a [`Block`] with the given [`Pmt`](futuresdr_types::Pmt).
     pub async fn callback(&self, handler: Handler, pmt: Pmt) -> Result<Pmt, Error> {
-        let url = match handler {
-            Handler::Name(n) => format!(
-                "{}/api/fg/{}/block/{}/call/{}/",
-                &self.url, self.flowgraph_id, self.description.id, n
-            ),
-            Handler::Id(i) => format!(
-                "{}/api/fg/{}/block/{}/call/{}/",
-                &self.url, self.flowgraph_id, self.description.id, i
-            ),
+        let handler = match handler {
+            Handler::Name(n) => n,
+            Handler::Id(i) => i.to_string(),
         };
+        let url = format!(
+            "{}/api/fg/{}/block/{}/call/{}/",
+            &self.url, self.flowgraph_id, self.description.id, handler
+        );
 
         Ok(self
             .client